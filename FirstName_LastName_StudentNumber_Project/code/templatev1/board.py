@@ -1,9 +1,19 @@
 # board.py
 
 from PyQt6.QtWidgets import QFrame
-from PyQt6.QtCore import Qt, QBasicTimer, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QFont
-from game_logic import GameLogic
+from PyQt6.QtCore import Qt, QBasicTimer, QElapsedTimer, QLine, QMetaMethod, QRect, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QFont, QPixmap, QPen, QBrush
+from game_logic import GameLogic, BLACK, WHITE, PLAYER_NAMES
+
+# Paint resources, built once instead of on every paint
+_BACKGROUND_COLOR = QColor(139, 69, 19)
+_GRID_PEN = QPen(Qt.GlobalColor.black)
+_STONE_BRUSHES = {
+    BLACK: QBrush(Qt.GlobalColor.black),
+    WHITE: QBrush(Qt.GlobalColor.white),
+}
+# Time-up result, indexed by the player (BLACK / WHITE) who ran out of time
+_TIME_UP_MESSAGES = ("", "Time's up! White wins on time.", "Time's up! Black wins on time.")
 
 class Board(QFrame):
     # Signals for scoreboard
@@ -18,10 +28,32 @@ class Board(QFrame):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Grid geometry, recomputed only in resizeEvent
+        self._squareSize = 0
+        self._offsetX = 0
+        self._offsetY = 0
+        self._gridLines = []
+        # Background + grid, rendered once per resize
+        self._boardPixmap = QPixmap()
+        # One pre-rendered stone per colour, sized to the current squares
+        self._stonePixmaps = {}
+        # (diameter, device pixel ratio) the stone pixmaps were rendered at
+        self._stonePixmapKey = None
+        # Radius of the stones in those pixmaps
+        self._stoneRadius = 0
+        # Last value sent through updateTimerSignal
+        self._lastCounter = None
+        # Wall clock for the countdown; ticks only sample it, so they can't drift
+        self._clock = QElapsedTimer()
+        self._totalMs = 0
+        # Used to skip building log strings nobody is listening for
+        self._infoMeta = QMetaMethod.fromSignal(self.infoMessageSignal)
+        self._clickMeta = QMetaMethod.fromSignal(self.clickLocationSignal)
+
         self.initBoard()
         self.setMinimumSize(200, 200)
 
-        self.currentPlayer = "Black"
+        self.currentPlayer = BLACK
         self.blackCaptures = 0
         self.whiteCaptures = 0
         self.blackTerritory = 0
@@ -31,6 +63,12 @@ class Board(QFrame):
         """
         Initialize the board logic & timer
         """
+        # paintEvent covers the whole widget with the board pixmap, so skip
+        # QFrame's frame drawing and Qt's background erase
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+
         self.timer = QBasicTimer()
         self.isStarted = False
 
@@ -39,6 +77,7 @@ class Board(QFrame):
         self.gameLogic.capturesUpdatedSignal.connect(self.onCapturesUpdated)
         self.gameLogic.territoryUpdatedSignal.connect(self.onTerritoryUpdated)
         self.gameLogic.gameOverSignal.connect(self.onGameOver)
+        self.gameLogic.boardChangedSignal.connect(self.onBoardChanged)
 
         self.start()
 
@@ -48,114 +87,197 @@ class Board(QFrame):
         """
         self.isStarted = True
         self.resetGame()
-        self.timer.start(self.timerSpeed, self)
+        self.timer.start(self.timerSpeed, Qt.TimerType.CoarseTimer, self)
         self.infoMessageSignal.emit("Game started. 5 minutes on the clock.")
 
     def timerEvent(self, event):
         """Countdown logic for 5 minutes total."""
         if event.timerId() == self.timer.timerId():
+            remainingMs = max(0, self._totalMs - self._clock.elapsed())
+            # Round up so the display reads 0 only once time is really out
+            self.counter = (remainingMs + 999) // 1000
+            if self.counter != self._lastCounter:
+                self._lastCounter = self.counter
+                self.updateTimerSignal.emit(self.counter)
+
             if self.counter == 0:
+                # Stop first so no further ticks are queued
+                self.timer.stop()
+                self.isStarted = False
+
                 # Time’s up: The other player wins
-                if self.currentPlayer == "Black":
-                    winner = "White"
-                else:
-                    winner = "Black"
-                msg = f"Time's up! {winner} wins on time."
+                msg = _TIME_UP_MESSAGES[self.currentPlayer]
                 self.infoMessageSignal.emit(msg)
 
-                self.isStarted = False
-                self.timer.stop()
-
                 # Trigger scoreboard popup
                 self.gameLogic.gameOverSignal.emit(msg)
-
-            else:
-                self.counter -= 1
-                self.updateTimerSignal.emit(self.counter)
         else:
             super(Board, self).timerEvent(event)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def resizeEvent(self, event):
+        """
+        Recompute the grid geometry once per resize instead of on every paint
+        """
+        s = min(self.width(), self.height()) / self.boardWidth
+        self._squareSize = s
+        self._offsetX = (self.width() - s * self.boardWidth) / 2
+        self._offsetY = (self.height() - s * self.boardHeight) / 2
+        self._rebuildGridCache()
+        self._rebuildStonePixmaps()
+        super().resizeEvent(event)
+
+    def _rebuildGridCache(self):
+        """
+        Rebuild the grid lines and board pixmap from the cached geometry
+        """
+        s = self._squareSize
+        # Pixel-snapped line positions, rounded once here rather than per paint
+        xs = [int(self._offsetX + col * s) for col in range(self.boardWidth + 1)]
+        ys = [int(self._offsetY + row * s) for row in range(self.boardHeight + 1)]
+        # The grid is (height + 1) horizontal and (width + 1) vertical lines
+        self._gridLines = [
+            QLine(xs[0], y, xs[-1], y) for y in ys
+        ] + [
+            QLine(x, ys[0], x, ys[-1]) for x in xs
+        ]
+        self._rebuildBoardPixmap()
+
+    def _rebuildBoardPixmap(self):
+        """
+        Render the static background and grid into a pixmap that paintEvent blits
+        """
+        ratio = self.devicePixelRatioF()
+        self._boardPixmap = QPixmap(self.size() * ratio)
+        self._boardPixmap.setDevicePixelRatio(ratio)
+        painter = QPainter(self._boardPixmap)
+        # Axis-aligned grid lines need no antialiasing
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         self.drawBackground(painter)
         self.drawBoardSquares(painter)
+        painter.end()
+
+    def _rebuildStonePixmaps(self):
+        """
+        Render one black and one white stone at the current square size, so
+        drawing a stone is a single pixmap blit. Kept as is when a resize
+        leaves the stone size unchanged.
+        """
+        self._stoneRadius = int(self._squareSize // 2) - 2
+        diameter = 2 * self._stoneRadius
+        ratio = self.devicePixelRatioF()
+        if self._stonePixmapKey == (diameter, ratio):
+            return
+        self._stonePixmapKey = (diameter, ratio)
+        # +1 leaves room for the outline pen on the right/bottom edge
+        side = max(diameter + 1, 1)
+        for color, brush in _STONE_BRUSHES.items():
+            pixmap = QPixmap(int(side * ratio), int(side * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            painter.setPen(_GRID_PEN)
+            painter.setBrush(brush)
+            painter.drawEllipse(0, 0, diameter, diameter)
+            painter.end()
+            self._stonePixmaps[color] = pixmap
+
+    def stonePixmap(self, color):
+        """
+        Pre-rendered stone for BLACK or WHITE, used by GameLogic.drawPieces
+        """
+        return self._stonePixmaps[color]
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._boardPixmap)
         self.gameLogic.drawPieces(
-            painter, self.squareWidth(), self.squareHeight(),
-            self.width(), self.height()
+            painter, self._squareSize, self._squareSize,
+            self.width(), self.height(), self.stonePixmap, self._stoneRadius,
+            event.region()
         )
 
     def drawBackground(self, painter):
-        painter.fillRect(self.rect(), QColor(139, 69, 19))
+        painter.fillRect(self.rect(), _BACKGROUND_COLOR)
 
     def drawBoardSquares(self, painter):
-        painter.setPen(Qt.GlobalColor.black)
-        square_size = self.squareWidth()
-        offsetX = (self.width() - square_size * self.boardWidth) / 2
-        offsetY = (self.height() - square_size * self.boardHeight) / 2
-
-        for row in range(self.boardHeight):
-            for col in range(self.boardWidth):
-                left = int(offsetX + col * square_size)
-                top = int(offsetY + row * square_size)
-                painter.drawRect(left, top, int(square_size), int(square_size))
+        painter.setPen(_GRID_PEN)
+        painter.drawLines(self._gridLines)
 
     def mousePressEvent(self, event):
         if not self.isStarted:
             return
 
-        x, y = event.position().x(), event.position().y()
-        offsetX = (self.width() - self.squareWidth() * self.boardWidth) / 2
-        offsetY = (self.height() - self.squareHeight() * self.boardHeight) / 2
-
-        col = int((x - offsetX) / self.squareWidth())
-        row = int((y - offsetY) / self.squareHeight())
+        pos = event.position()
+        s = self._squareSize
+        col = int((pos.x() - self._offsetX) / s)
+        row = int((pos.y() - self._offsetY) / s)
         if 0 <= row < self.boardHeight and 0 <= col < self.boardWidth:
-            clickLoc = f"[{col}, {row}]"
-            self.clickLocationSignal.emit(clickLoc)
-            self.infoMessageSignal.emit(f"Clicked on {clickLoc}")
+            if self.isSignalConnected(self._clickMeta):
+                self.clickLocationSignal.emit(f"[{col}, {row}]")
+            if self.isSignalConnected(self._infoMeta):
+                self.infoMessageSignal.emit(f"Clicked on [{col}, {row}]")
+            # A valid move repaints only the cells it changed (onBoardChanged)
             self.gameLogic.handleMove(row, col)
-            self.update()
 
     def passMove(self):
         if not self.isStarted:
             return
         self.infoMessageSignal.emit("Player passes.")
         self.gameLogic.passMove()
-        self.update()
 
     def resetGame(self):
         self.gameLogic.resetGame()
         self.counter = 300  # reset to 5 minutes
+        self._totalMs = self.counter * 1000
+        self._clock.start()
         self.update()
         self.infoMessageSignal.emit("Game reset. Clock back to 5 minutes.")
 
+    def _cellRect(self, row, col):
+        """
+        Pixel rect of one board cell, padded to cover the grid lines on its edge
+        """
+        s = self._squareSize
+        return QRect(
+            int(self._offsetX + col * s), int(self._offsetY + row * s),
+            int(s), int(s)
+        ).adjusted(-1, -1, 1, 1)
+
     def squareWidth(self):
-        return min(self.width(), self.height()) / self.boardWidth
+        return self._squareSize
 
     def squareHeight(self):
-        return self.squareWidth()
+        return self._squareSize
 
     # -------------------- Game Logic Slots --------------------
     def onCurrentPlayerChanged(self, player):
         self.currentPlayer = player
-        self.infoMessageSignal.emit(f"Current player changed to {player}")
-        self.update()
+        if self.isSignalConnected(self._infoMeta):
+            self.infoMessageSignal.emit(f"Current player changed to {PLAYER_NAMES[player]}")
 
     def onCapturesUpdated(self, blackCaptures, whiteCaptures):
         self.blackCaptures = blackCaptures
         self.whiteCaptures = whiteCaptures
-        self.infoMessageSignal.emit(
-            f"Captures => Black: {blackCaptures}, White: {whiteCaptures}"
-        )
-        self.update()
+        if self.isSignalConnected(self._infoMeta):
+            self.infoMessageSignal.emit(
+                f"Captures => Black: {blackCaptures}, White: {whiteCaptures}"
+            )
 
     def onTerritoryUpdated(self, blackTerr, whiteTerr):
         self.blackTerritory = blackTerr
         self.whiteTerritory = whiteTerr
-        self.infoMessageSignal.emit(
-            f"Territory => Black: {blackTerr}, White: {whiteTerr}"
-        )
-        self.update()
+        if self.isSignalConnected(self._infoMeta):
+            self.infoMessageSignal.emit(
+                f"Territory => Black: {blackTerr}, White: {whiteTerr}"
+            )
+
+    def onBoardChanged(self, cells):
+        """
+        Repaint only the cells touched by the last move
+        """
+        for row, col in cells:
+            self.update(self._cellRect(row, col))
 
     def onGameOver(self, resultMsg):
         self.isStarted = False
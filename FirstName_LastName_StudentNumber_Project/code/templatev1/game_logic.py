@@ -1,9 +1,12 @@
 # game_logic.py
 
-from copy import deepcopy
-from PyQt6.QtCore import QObject, pyqtSignal
-from PyQt6.QtGui import QPainter, QBrush
-from PyQt6.QtCore import Qt
+import math
+from PyQt6.QtCore import QObject, QRect, pyqtSignal
+from go_rules import GoRules, EMPTY, BLACK, WHITE
+
+# Display names, indexed by BLACK / WHITE
+PLAYER_NAMES = ("", "Black", "White")
+
 
 class GameLogic(QObject):
     """
@@ -18,26 +21,36 @@ class GameLogic(QObject):
     """
 
     # Signals for ScoreBoard
-    currentPlayerChangedSignal = pyqtSignal(str)    
+    currentPlayerChangedSignal = pyqtSignal(int)    
     capturesUpdatedSignal      = pyqtSignal(int, int)  
     territoryUpdatedSignal     = pyqtSignal(int, int)
     gameOverSignal             = pyqtSignal(str)
+    # Cells (row, col) whose stone changed, for partial repaints
+    boardChangedSignal         = pyqtSignal(list)
+    # Whole scoreboard state in one emit, at most once per move/pass/reset:
+    # (currentPlayer, blackCaptures, whiteCaptures, blackTerritory, whiteTerritory)
+    stateChangedSignal         = pyqtSignal(int, int, int, int, int)
 
     def __init__(self, width, height, parent=None):
         super().__init__(parent)
         self.width = width
         self.height = height
 
-        # For superko
-        self.allBoardSignatures = set()
+        # Board position and rules (captures, suicide, superko, territory)
+        self.rules = GoRules(width, height)
+        # Last values sent to the scoreboard, so unchanged values aren't re-sent
+        self._lastPlayer = None
+        self._lastCaptures = None
+        self._lastTerritory = None
+        self._lastState = None
         self.resetGame()
 
     def resetGame(self):
         """
         Reset everything for a new game.
         """
-        self.boardArray = [[None for _ in range(self.width)] for _ in range(self.height)]
-        self.currentPlayer = "B"
+        self.rules.reset()
+        self.currentPlayer = BLACK
         self.blackCaptures = 0
         self.whiteCaptures = 0
         self.blackTerritory = 0
@@ -45,11 +58,6 @@ class GameLogic(QObject):
         self.consecutivePasses = 0
         self.gameOver = False
 
-        self.allBoardSignatures.clear()
-        # Record the initial empty board
-        initialSig = self._getBoardSignature(self.boardArray)
-        self.allBoardSignatures.add(initialSig)
-
         self._emitInitialSignals()
 
     def handleMove(self, row, col):
@@ -70,47 +78,33 @@ class GameLogic(QObject):
             return
 
         # Must be empty
-        if self.boardArray[row][col] is not None:
+        idx = row*self.width + col
+        if self.boardArray[idx] != EMPTY:
             return
 
-        # Keep old board + captures in case we revert
-        oldBoard = deepcopy(self.boardArray)
-        oldBlackCaptures = self.blackCaptures
-        oldWhiteCaptures = self.whiteCaptures
+        player = self.currentPlayer
 
-        # Place stone
-        self.boardArray[row][col] = self.currentPlayer
         self.consecutivePasses = 0
-
-        # Capture
-        capturedStones = self._captureOpponents()
-
-        # Check suicide
-        group, liberties = self._get_group_and_liberties(row, col, self.currentPlayer)
-        if liberties == 0 and capturedStones == 0:
-            # revert
-            self.boardArray[row][col] = None
+        move = self.rules.resolveMove(idx, player)
+        if move is None:
             return
+        capturedStones, newHash = move
 
-        # If captures occurred, update scoreboard
-        if capturedStones > 0:
-            self.capturesUpdatedSignal.emit(self.blackCaptures, self.whiteCaptures)
-
-        # Now compute the new board signature
-        newSig = self._getBoardSignature(self.boardArray)
-        # **SUPERKO** 
-        if newSig in self.allBoardSignatures:
-            # revert
-            self.boardArray = oldBoard
-            self.blackCaptures = oldBlackCaptures
-            self.whiteCaptures = oldWhiteCaptures
-            return
-
-        # If valid, record newSig in the history
-        self.allBoardSignatures.add(newSig)
+        # Valid: commit the captures and record the new position
+        self.rules.playMove(idx, player, capturedStones, newHash)
+        if capturedStones:
+            if player == BLACK:
+                self.blackCaptures += len(capturedStones)
+            else:
+                self.whiteCaptures += len(capturedStones)
+            self._emitCaptures()
+        self.boardChangedSignal.emit(
+            [(row, col)] + [divmod(i, self.width) for i in capturedStones]
+        )
 
         # Switch player
         self._switchPlayer()
+        self._emitState()
 
     def passMove(self):
         """
@@ -123,151 +117,101 @@ class GameLogic(QObject):
         if self.consecutivePasses >= 2:
             self.gameOver = True
             self._computeTerritory()
+            self._emitState()
             self._emitFinalResult()
             return
         
         # Add the current position to history 
         # to a previously seen position
-        newSig = self._getBoardSignature(self.boardArray)
-        self.allBoardSignatures.add(newSig)
+        self.rules.recordPosition()
 
         self._switchPlayer()
+        self._emitState()
 
-    def drawPieces(self, painter, squareWidth, squareHeight, boardPixelWidth, boardPixelHeight):
+    def drawPieces(self, painter, squareWidth, squareHeight, boardPixelWidth, boardPixelHeight,
+                   stonePixmap, stoneRadius, region=None):
         """
         Draw black and white stones onto the board.
+        'stonePixmap(color)' returns the pre-rendered stone for BLACK/WHITE,
+        a circle of 'stoneRadius' drawn from the pixmap's top-left corner.
+        Stones outside 'region' (the paint event's dirty area) are skipped.
         """
         offsetX = (boardPixelWidth - (squareWidth * self.width)) / 2
         offsetY = (boardPixelHeight - (squareHeight * self.height)) / 2
-        radius = int(min(squareWidth, squareHeight)//2) - 2
-
-        for row in range(self.height):
-            for col in range(self.width):
-                stone = self.boardArray[row][col]
-                if stone in ("B", "W"):
-                    centerX = offsetX + col*squareWidth + squareWidth/2
-                    centerY = offsetY + row*squareHeight + squareHeight/2
-                    painter.setPen(Qt.GlobalColor.black)
-                    if stone == "B":
-                        painter.setBrush(QBrush(Qt.GlobalColor.black))
-                    else:
-                        painter.setBrush(QBrush(Qt.GlobalColor.white))
-                    painter.drawEllipse(
-                        int(centerX - radius),
-                        int(centerY - radius),
-                        2*radius, 2*radius
-                    )
-
-    # -----------------------------------------------------------------
-    # Superko Helpers
-    # -----------------------------------------------------------------
-    def _getBoardSignature(self, board):
-        """
-        Return a string uniquely identifying 'board' layout.
-        We ignore captures or current player in the signature,
-        focusing purely on stone placements. (This is typical for superko.)
-        """
-        rows = []
-        for r in range(self.height):
-            row_str = "".join('.' if board[r][c] is None else board[r][c]
-                              for c in range(self.width))
-            rows.append(row_str)
-        return "\n".join(rows)
+        # Area a stone blit covers, taken from the pixmap itself
+        size = stonePixmap(BLACK).deviceIndependentSize()
+        stoneW, stoneH = math.ceil(size.width()), math.ceil(size.height())
+
+        # Top-left corner of a stone in each column/row, computed once per paint
+        lefts = [int(offsetX + col*squareWidth + squareWidth/2 - stoneRadius) for col in range(self.width)]
+        tops = [int(offsetY + row*squareHeight + squareHeight/2 - stoneRadius) for row in range(self.height)]
+
+        width = self.width
+        drawPixmap = painter.drawPixmap
+        for color in (BLACK, WHITE):
+            pixmap = stonePixmap(color)
+            for i in self.stones[color]:
+                row, col = divmod(i, width)
+                left, top = lefts[col], tops[row]
+                if region is not None and not region.intersects(QRect(left, top, stoneW, stoneH)):
+                    continue
+                drawPixmap(left, top, pixmap)
+
+    # -----------------------------------------
+    # Position (owned by self.rules)
+    # -----------------------------------------
+    @property
+    def boardArray(self):
+        return self.rules.boardArray
+
+    @property
+    def stones(self):
+        return self.rules.stones
+
+    @property
+    def emptyCount(self):
+        return self.rules.emptyCount
 
     # -----------------------------------------
     # Internal Helpers
     # -----------------------------------------
     def _emitInitialSignals(self):
-        self.currentPlayerChangedSignal.emit("Black")
-        self.capturesUpdatedSignal.emit(self.blackCaptures, self.whiteCaptures)
-        self.territoryUpdatedSignal.emit(self.blackTerritory, self.whiteTerritory)
+        self._emitCurrentPlayer()
+        self._emitCaptures()
+        self._emitTerritory()
+        self._emitState()
+
+    def _emitCurrentPlayer(self):
+        if self.currentPlayer != self._lastPlayer:
+            self._lastPlayer = self.currentPlayer
+            self.currentPlayerChangedSignal.emit(self.currentPlayer)
+
+    def _emitCaptures(self):
+        captures = (self.blackCaptures, self.whiteCaptures)
+        if captures != self._lastCaptures:
+            self._lastCaptures = captures
+            self.capturesUpdatedSignal.emit(*captures)
+
+    def _emitTerritory(self):
+        territory = (self.blackTerritory, self.whiteTerritory)
+        if territory != self._lastTerritory:
+            self._lastTerritory = territory
+            self.territoryUpdatedSignal.emit(*territory)
+
+    def _emitState(self):
+        state = (self.currentPlayer, self.blackCaptures, self.whiteCaptures,
+                 self.blackTerritory, self.whiteTerritory)
+        if state != self._lastState:
+            self._lastState = state
+            self.stateChangedSignal.emit(*state)
 
     def _switchPlayer(self):
-        if self.currentPlayer == "B":
-            self.currentPlayer = "W"
-            self.currentPlayerChangedSignal.emit("White")
-        else:
-            self.currentPlayer = "B"
-            self.currentPlayerChangedSignal.emit("Black")
-
-    def _captureOpponents(self):
-        opponent = "W" if self.currentPlayer == "B" else "B"
-        captured_stones = 0
-        visited = set()
-
-        for r in range(self.height):
-            for c in range(self.width):
-                if self.boardArray[r][c] == opponent and (r, c) not in visited:
-                    group, liberties = self._get_group_and_liberties(r, c, opponent)
-                    visited.update(group)
-                    if liberties == 0:
-                        for (gr, gc) in group:
-                            self.boardArray[gr][gc] = None
-                        captured_stones += len(group)
-
-        if captured_stones > 0:
-            if self.currentPlayer == "B":
-                self.blackCaptures += captured_stones
-            else:
-                self.whiteCaptures += captured_stones
-
-        return captured_stones
-
-    def _get_group_and_liberties(self, start_row, start_col, color):
-        stack = [(start_row, start_col)]
-        visited = {(start_row, start_col)}
-        group = []
-        liberties = 0
-
-        while stack:
-            r, c = stack.pop()
-            group.append((r, c))
-            for nr, nc in [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]:
-                if 0 <= nr < self.height and 0 <= nc < self.width:
-                    if self.boardArray[nr][nc] is None:
-                        liberties += 1
-                    elif self.boardArray[nr][nc] == color and (nr, nc) not in visited:
-                        visited.add((nr, nc))
-                        stack.append((nr, nc))
-        return group, liberties
+        self.currentPlayer = WHITE if self.currentPlayer == BLACK else BLACK
+        self._emitCurrentPlayer()
 
     def _computeTerritory(self):
-        visited = set()
-        self.blackTerritory = 0
-        self.whiteTerritory = 0
-
-        for r in range(self.height):
-            for c in range(self.width):
-                if self.boardArray[r][c] is None and (r, c) not in visited:
-                    region, bordering_colors = self._explore_empty_region(r, c, visited)
-                    if len(bordering_colors) == 1:
-                        color = bordering_colors.pop()
-                        if color == "B":
-                            self.blackTerritory += len(region)
-                        elif color == "W":
-                            self.whiteTerritory += len(region)
-        self.territoryUpdatedSignal.emit(self.blackTerritory, self.whiteTerritory)
-
-    def _explore_empty_region(self, start_row, start_col, visited):
-        queue = [(start_row, start_col)]
-        region_positions = []
-        bordering_colors = set()
-        visited.add((start_row, start_col))
-
-        while queue:
-            r, c = queue.pop(0)
-            region_positions.append((r, c))
-
-            for nr, nc in [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]:
-                if 0 <= nr < self.height and 0 <= nc < self.width:
-                    if (nr, nc) not in visited:
-                        if self.boardArray[nr][nc] is None:
-                            visited.add((nr, nc))
-                            queue.append((nr, nc))
-                        else:
-                            bordering_colors.add(self.boardArray[nr][nc])
-
-        return region_positions, bordering_colors
+        self.blackTerritory, self.whiteTerritory = self.rules.territory()
+        self._emitTerritory()
 
     def _emitFinalResult(self):
         black_score = self.blackTerritory + self.blackCaptures
@@ -0,0 +1,293 @@
+# go_rules.py
+
+import random
+from collections import deque
+
+# Cell / player encoding used by boardArray and currentPlayer.
+# boardArray is a flat bytearray, cell (row, col) lives at row * width + col.
+EMPTY, BLACK, WHITE = 0, 1, 2
+# (row, col) offsets of the four orthogonal neighbours
+_NEIGHBORS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+# -----------------------------------------------------------------
+# Flood-fill kernels
+# Plain functions over the flat board: everything the inner loops touch
+# is a local, so there are no attribute lookups per cell. GoRules
+# methods are thin wrappers around them.
+# -----------------------------------------------------------------
+def _group_and_liberties(board, neighbors, marks, mark, start, color):
+    """
+    Return (cells, liberties) of the 'color' group containing cell 'start'.
+    Cells are flat indices; neighbors[i] lists the on-board neighbours of i.
+    A cell counts as visited when marks[cell] == mark, so 'marks' can be
+    reused across calls without clearing it.
+    A liberty touching several stones of the group is counted once per stone.
+    """
+    stack = [start]
+    marks[start] = mark
+    group = []
+    liberties = 0
+
+    while stack:
+        i = stack.pop()
+        group.append(i)
+        for n in neighbors[i]:
+            cell = board[n]
+            if cell == EMPTY:
+                liberties += 1
+            elif cell == color and marks[n] != mark:
+                marks[n] = mark
+                stack.append(n)
+    return group, liberties
+
+
+def _has_liberty(board, neighbors, marks, mark, start, color):
+    """
+    Return True if the 'color' group containing cell 'start' has at least
+    one liberty. Same arguments as _group_and_liberties, but the fill
+    stops at the first empty neighbour instead of walking the whole group.
+    """
+    stack = [start]
+    marks[start] = mark
+
+    while stack:
+        for n in neighbors[stack.pop()]:
+            cell = board[n]
+            if cell == EMPTY:
+                return True
+            if cell == color and marks[n] != mark:
+                marks[n] = mark
+                stack.append(n)
+    return False
+
+
+def _explore_empty_region(board, neighbors, marks, mark, start):
+    """
+    Return (size, bordering colours) of the empty region containing flat
+    cell 'start', setting marks[cell] = mark for each of its cells.
+    Bordering colours are OR-ed cell codes: BLACK or WHITE if only that
+    colour touches the region, BLACK | WHITE if both do, EMPTY if none.
+    """
+    queue = deque([start])
+    size = 0
+    bordering_colors = EMPTY
+    marks[start] = mark
+
+    while queue:
+        i = queue.popleft()
+        size += 1
+
+        for n in neighbors[i]:
+            if marks[n] != mark:
+                cell = board[n]
+                if cell == EMPTY:
+                    marks[n] = mark
+                    queue.append(n)
+                else:
+                    bordering_colors |= cell
+
+    return size, bordering_colors
+
+
+class GoRules(object):
+    """
+    The board position and the Go rules, without any Qt:
+      - Stone placement and capture of groups left without liberties
+      - Suicide rule (can't place a stone that dies unless it captures)
+      - **SUPERKO rule** (no returning to ANY previously seen board state)
+      - Territory counting
+    GameLogic owns one of these and turns its results into signals.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+        # For superko: Zobrist hashes of every position seen so far
+        self._zobrist = self._buildZobristTable()
+        # neighbors[i]: flat indices of the on-board neighbours of cell i
+        self._neighbors = self._buildNeighborTable()
+        # Reusable 'visited' marks for flood fills; each fill uses a new
+        # generation number, so the array only needs clearing when it wraps
+        self._visited = bytearray(width * height)
+        self._visitedGen = 0
+        self.allBoardSignatures = set()
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the board and the position history.
+        """
+        self.boardArray = bytearray(self.width * self.height)
+        # Flat indices of the stones of each colour, indexed by BLACK / WHITE,
+        # so drawing visits occupied cells only
+        self.stones = (None, set(), set())
+        # Number of empty cells, kept up to date as stones are placed/captured
+        self.emptyCount = self.width * self.height
+
+        self.allBoardSignatures.clear()
+        # Record the initial empty board (no stones => hash 0)
+        self.boardHash = 0
+        self.allBoardSignatures.add(self.boardHash)
+
+    def resolveMove(self, idx, player):
+        """
+        Decide a move at flat index 'idx' in one pass, without committing it.
+        Returns (captured stones, hash of the resulting position) with the
+        stone left on the board, or None with the board untouched if the
+        move is suicide or repeats a previous position (superko).
+        """
+        board = self.boardArray
+        board[idx] = player
+        capturedStones = self._findCaptured(idx, player)
+
+        # Suicide (a capture always leaves the new stone a liberty)
+        if not capturedStones and not self._hasAnyLiberty(idx, player):
+            board[idx] = EMPTY
+            return None
+
+        # Superko: hash of the prospective board, checked before committing
+        opponentKeys = self._zobrist[WHITE if player == BLACK else BLACK]
+        newHash = self.boardHash ^ self._zobrist[player][idx]
+        for i in capturedStones:
+            newHash ^= opponentKeys[i]
+        if newHash in self.allBoardSignatures:
+            board[idx] = EMPTY
+            return None
+
+        return capturedStones, newHash
+
+    def playMove(self, idx, player, capturedStones, newHash):
+        """
+        Commit a move accepted by resolveMove: remove the captured stones
+        and record the new position in the history.
+        """
+        board = self.boardArray
+        for i in capturedStones:
+            board[i] = EMPTY
+        self.stones[player].add(idx)
+        self.stones[WHITE if player == BLACK else BLACK].difference_update(capturedStones)
+        self.emptyCount += len(capturedStones) - 1
+        self.boardHash = newHash
+        self.allBoardSignatures.add(newHash)
+
+    def recordPosition(self):
+        """
+        Add the current position to the history (used when a player passes).
+        """
+        self.allBoardSignatures.add(self.boardHash)
+
+    def territory(self):
+        """
+        Return (black, white) territory: empty regions bordered by one
+        colour only count for that colour.
+        """
+        # A full board has no territory, an empty one borders no colour
+        if self.emptyCount in (0, self.width * self.height):
+            return 0, 0
+
+        # One generation of the shared visited marks covers the whole scan
+        mark = self._nextVisitedGen()
+        board = self.boardArray
+        neighbors = self._neighbors
+        visited = self._visited
+        blackTerritory = whiteTerritory = 0
+        # bytearray.find jumps straight to the next empty cell
+        i = board.find(EMPTY)
+        while i != -1:
+            if visited[i] != mark:
+                size, bordering_colors = _explore_empty_region(board, neighbors, visited, mark, i)
+                if bordering_colors == BLACK:
+                    blackTerritory += size
+                elif bordering_colors == WHITE:
+                    whiteTerritory += size
+            i = board.find(EMPTY, i + 1)
+        return blackTerritory, whiteTerritory
+
+    # -----------------------------------------------------------------
+    # Superko Helpers
+    # -----------------------------------------------------------------
+    def _buildZobristTable(self):
+        """
+        One random 64-bit key per (colour, cell), indexed [BLACK/WHITE][cell].
+        The board hash is the XOR of the keys of every stone on the board,
+        so placing or removing a stone updates it with a single XOR.
+        We ignore captures or current player in the hash,
+        focusing purely on stone placements. (This is typical for superko.)
+        """
+        rng = random.Random(0)
+        cells = self.width * self.height
+        return (None,
+                [rng.getrandbits(64) for _ in range(cells)],
+                [rng.getrandbits(64) for _ in range(cells)])
+
+    # -----------------------------------------
+    # Internal Helpers
+    # -----------------------------------------
+    def _buildNeighborTable(self):
+        """
+        Precompute, for every flat cell index, the indices of its up to four
+        on-board neighbours, so flood fills need no bounds checks.
+        """
+        table = []
+        for r in range(self.height):
+            for c in range(self.width):
+                table.append(tuple(
+                    (r + dr)*self.width + (c + dc)
+                    for dr, dc in _NEIGHBORS
+                    if 0 <= r + dr < self.height and 0 <= c + dc < self.width
+                ))
+        return table
+
+    def _findCaptured(self, idx, player):
+        """
+        Return the (flat) opponent stones left without liberties by the stone
+        'player' just placed at 'idx', without modifying the board. Only
+        groups touching that stone can have lost their last liberty, so the
+        rest of the board is never flood-filled.
+        """
+        opponent = WHITE if player == BLACK else BLACK
+        board = self.boardArray
+        neighbors = self._neighbors
+        visited = self._visited
+        captured = []
+        # Stones of dead groups, and the fill generations that found a
+        # liberty: a stone marked by one of those fills is in a live group
+        # already checked, so a group touching the new stone on several
+        # sides is only filled once either way
+        seen = set()
+        liveMarks = []
+
+        for n in neighbors[idx]:
+            if board[n] != opponent or n in seen or visited[n] in liveMarks:
+                continue
+            # Most groups survive: stop at their first liberty and only
+            # collect the full group when it is actually dead
+            mark = self._nextVisitedGen()
+            if _has_liberty(board, neighbors, visited, mark, n, opponent):
+                liveMarks.append(mark)
+                continue
+            group, _ = self._get_group_and_liberties(n, opponent)
+            seen.update(group)
+            captured.extend(group)
+        return captured
+
+    def _get_group_and_liberties(self, start, color):
+        return _group_and_liberties(self.boardArray, self._neighbors,
+                                    self._visited, self._nextVisitedGen(), start, color)
+
+    def _hasAnyLiberty(self, start, color):
+        return _has_liberty(self.boardArray, self._neighbors,
+                            self._visited, self._nextVisitedGen(), start, color)
+
+    def _nextVisitedGen(self):
+        """
+        Start a new flood fill: bump the generation marking visited cells,
+        clearing the marks when it wraps.
+        """
+        self._visitedGen += 1
+        if self._visitedGen == 256:
+            self._visited[:] = bytes(len(self._visited))
+            self._visitedGen = 1
+        return self._visitedGen
@@ -2,9 +2,53 @@
 
 from PyQt6.QtWidgets import (
     QDockWidget, QVBoxLayout, QWidget, QLabel,
-    QGroupBox, QHBoxLayout, QPushButton, QMessageBox, QPlainTextEdit
+    QGroupBox, QGridLayout, QPushButton, QMessageBox, QPlainTextEdit
 )
 from PyQt6.QtCore import pyqtSlot, Qt
+from PyQt6.QtGui import QTextCursor
+from game_logic import PLAYER_NAMES
+
+# Fixed label texts, built once; only the number is formatted per update
+_PLAYER_LABELS = tuple("Current Player: " + name for name in PLAYER_NAMES)
+_BLACK_CAPS_PREFIX = "Black Caps: "
+_WHITE_CAPS_PREFIX = "White Caps: "
+_BLACK_TERR_PREFIX = "Black Terr: "
+_WHITE_TERR_PREFIX = "White Terr: "
+
+# STYLE UWU: dark theme for the dock, parsed from one shared string
+_DARK_STYLESHEET = """
+    QDockWidget {
+        background-color: #2D2D2D;
+        color: #EEEEEE;
+        font-family: Arial;
+        font-size: 14px;
+    }
+    QGroupBox {
+        margin-top: 10px;
+        border: 2px solid #888888;
+        border-radius: 5px;
+        font-weight: bold;
+        color: #FFFFFF;
+    }
+    QLabel {
+        color: #DDDDDD;
+    }
+    QPushButton {
+        background-color: #444444;
+        color: #FFFFFF;
+        border: 1px solid #AAAAAA;
+        border-radius: 4px;
+        padding: 5px 10px;
+    }
+    QPushButton:hover {
+        background-color: #666666;
+    }
+    QPlainTextEdit {
+        background-color: #1E1E1E;
+        color: #DDDDDD;
+        border: 1px solid #555555;
+    }
+"""
 
 class ScoreBoard(QDockWidget):
     """
@@ -20,8 +64,10 @@ class ScoreBoard(QDockWidget):
     def __init__(self):
         super().__init__()
         self.board = None
-        # We'll keep a list of messages, with the newest at index 0
-        self.logMessages = []
+        # Seconds currently shown on the timer label
+        self._shownTime = None
+        # Game-over popup, built on the first game over and reused after
+        self._gameOverBox = None
         self.initUI()
 
     def initUI(self):
@@ -33,55 +79,19 @@ class ScoreBoard(QDockWidget):
         self.setWidget(self.mainWidget)
         self.mainLayout = QVBoxLayout(self.mainWidget)
 
-        # STYLE UWU
-        self.setStyleSheet("""
-            QDockWidget {
-                background-color: #2D2D2D;
-                color: #EEEEEE;
-                font-family: Arial;
-                font-size: 14px;
-            }
-            QGroupBox {
-                margin-top: 10px;
-                border: 2px solid #888888;
-                border-radius: 5px;
-                font-weight: bold;
-                color: #FFFFFF;
-            }
-            QLabel {
-                color: #DDDDDD;
-            }
-            QPushButton {
-                background-color: #444444;
-                color: #FFFFFF;
-                border: 1px solid #AAAAAA;
-                border-radius: 4px;
-                padding: 5px 10px;
-            }
-            QPushButton:hover {
-                background-color: #666666;
-            }
-            QPlainTextEdit {
-                background-color: #1E1E1E;
-                color: #DDDDDD;
-                border: 1px solid #555555;
-            }
-        """)
-
         # ------------------ Timer + Controls  ------------------
+        # One grid per group instead of nested row layouts
         topGroup = QGroupBox("Game Controls")
-        topLayout = QVBoxLayout()
+        topLayout = QGridLayout()
 
         self.label_timeRemaining = QLabel("Time: 60s")
-        topLayout.addWidget(self.label_timeRemaining)
+        topLayout.addWidget(self.label_timeRemaining, 0, 0, 1, 2)
 
-        # Buttons layout
-        btnLayout = QHBoxLayout()
+        # Buttons row
         self.passButton = QPushButton("Pass")
-        btnLayout.addWidget(self.passButton)
+        topLayout.addWidget(self.passButton, 1, 0)
         self.resetButton = QPushButton("Reset")
-        btnLayout.addWidget(self.resetButton)
-        topLayout.addLayout(btnLayout)
+        topLayout.addWidget(self.resetButton, 1, 1)
 
         topGroup.setLayout(topLayout)
         self.mainLayout.addWidget(topGroup)
@@ -92,24 +102,22 @@ class ScoreBoard(QDockWidget):
 
         # ------------------ Scores (Current Player, Captures, Territory) ------------------
         scoreGroup = QGroupBox("Scores")
-        scoreLayout = QVBoxLayout()
+        scoreLayout = QGridLayout()
 
         self.label_currentPlayer = QLabel("Current Player: Black")
-        scoreLayout.addWidget(self.label_currentPlayer)
+        scoreLayout.addWidget(self.label_currentPlayer, 0, 0, 1, 2)
 
-        capturesLayout = QHBoxLayout()
+        # Captures row
         self.label_blackCaptures = QLabel("Black Caps: 0")
         self.label_whiteCaptures = QLabel("White Caps: 0")
-        capturesLayout.addWidget(self.label_blackCaptures)
-        capturesLayout.addWidget(self.label_whiteCaptures)
-        scoreLayout.addLayout(capturesLayout)
+        scoreLayout.addWidget(self.label_blackCaptures, 1, 0)
+        scoreLayout.addWidget(self.label_whiteCaptures, 1, 1)
 
-        territoryLayout = QHBoxLayout()
+        # Territory row
         self.label_blackTerritory = QLabel("Black Terr: 0")
         self.label_whiteTerritory = QLabel("White Terr: 0")
-        territoryLayout.addWidget(self.label_blackTerritory)
-        territoryLayout.addWidget(self.label_whiteTerritory)
-        scoreLayout.addLayout(territoryLayout)
+        scoreLayout.addWidget(self.label_blackTerritory, 2, 0)
+        scoreLayout.addWidget(self.label_whiteTerritory, 2, 1)
 
         scoreGroup.setLayout(scoreLayout)
         self.mainLayout.addWidget(scoreGroup)
@@ -119,11 +127,17 @@ class ScoreBoard(QDockWidget):
         logLayout = QVBoxLayout()
         self.gameLogText = QPlainTextEdit()
         self.gameLogText.setReadOnly(True)
+        # Read-only log: no undo history to record for every inserted line
+        self.gameLogText.setUndoRedoEnabled(False)
         logLayout.addWidget(self.gameLogText)
         logGroup.setLayout(logLayout)
         self.mainLayout.addWidget(logGroup)
 
         self.mainWidget.setLayout(self.mainLayout)
+
+        # Style applied once the whole widget tree exists, so the
+        # selectors are resolved in one pass rather than per added child
+        self.setStyleSheet(_DARK_STYLESHEET)
         self.show()
 
     def make_connection(self, board):
@@ -133,63 +147,73 @@ class ScoreBoard(QDockWidget):
         self.board = board
 
         # Board signals
-        board.clickLocationSignal.connect(self.onClickLocation)
         board.updateTimerSignal.connect(self.onTimeUpdate)
+        # Default AutoConnection: emits from another thread are already
+        # queued onto the GUI thread, same-thread emits stay direct
         board.infoMessageSignal.connect(self.onInfoMessage)
 
-        # GameLogic signals
+        # GameLogic signals: one aggregated state update per move for the labels
         gameLogic = board.gameLogic
-        gameLogic.currentPlayerChangedSignal.connect(self.onCurrentPlayerChanged)
-        gameLogic.capturesUpdatedSignal.connect(self.onCapturesUpdated)
-        gameLogic.territoryUpdatedSignal.connect(self.onTerritoryUpdated)
+        gameLogic.stateChangedSignal.connect(self.onStateChanged)
         gameLogic.gameOverSignal.connect(self.onGameOver)
 
     # ------------------------------ Board Slots ------------------------------
-    @pyqtSlot(str)
-    def onClickLocation(self, clickLoc):
-        # Optionally do nothing, or just log it
-        # Never used it 
-        pass
-
     @pyqtSlot(int)
     def onTimeUpdate(self, timeRemaining):
         """
         Update the scoreboard with the countdown
         """
-        self.label_timeRemaining.setText(f"Time: {timeRemaining}s")
+        if timeRemaining == self._shownTime:
+            return
+        self._shownTime = timeRemaining
+        self.label_timeRemaining.setText("Time: " + str(timeRemaining) + "s")
 
     @pyqtSlot(str)
     def onInfoMessage(self, message):
         """
-        We want the newest message on top => Insert at index 0 in self
+        We want the newest message on top => insert at the start of the
+        log document, which is the only copy of the log (no full-text rebuild)
         """
-        self.logMessages.insert(0, message)
-        # We could rejoin them with \n
-        self.gameLogText.setPlainText("\n".join(self.logMessages))
+        document = self.gameLogText.document()
+        # A fresh cursor on the document sits at its start
+        cursor = QTextCursor(document)
+        cursor.insertText(message if document.isEmpty() else message + "\n")
 
     # ------------------------------ GameLogic Slots ------------------------------
-    @pyqtSlot(str)
+    @pyqtSlot(int, int, int, int, int)
+    def onStateChanged(self, player, blackCaps, whiteCaps, blackTerr, whiteTerr):
+        """
+        Update every score label from one signal, with repaints held until
+        all are set. GameLogic only emits it when the state changed.
+        """
+        self.mainWidget.setUpdatesEnabled(False)
+        self.onCurrentPlayerChanged(player)
+        self.onCapturesUpdated(blackCaps, whiteCaps)
+        self.onTerritoryUpdated(blackTerr, whiteTerr)
+        self.mainWidget.setUpdatesEnabled(True)
+
+    @pyqtSlot(int)
     def onCurrentPlayerChanged(self, playerColor):
         """
         Update label for the current player
         """
-        self.label_currentPlayer.setText(f"Current Player: {playerColor}")
+        self.label_currentPlayer.setText(_PLAYER_LABELS[playerColor])
 
     @pyqtSlot(int, int)
     def onCapturesUpdated(self, blackCaps, whiteCaps):
         """
         Update captures for Black/White
         """
-        self.label_blackCaptures.setText(f"Black Caps: {blackCaps}")
-        self.label_whiteCaptures.setText(f"White Caps: {whiteCaps}")
+        self.label_blackCaptures.setText(_BLACK_CAPS_PREFIX + str(blackCaps))
+        self.label_whiteCaptures.setText(_WHITE_CAPS_PREFIX + str(whiteCaps))
 
     @pyqtSlot(int, int)
     def onTerritoryUpdated(self, blackTerr, whiteTerr):
         """
         Update territory counts
         """
-        self.label_blackTerritory.setText(f"Black Terr: {blackTerr}")
-        self.label_whiteTerritory.setText(f"White Terr: {whiteTerr}")
+        self.label_blackTerritory.setText(_BLACK_TERR_PREFIX + str(blackTerr))
+        self.label_whiteTerritory.setText(_WHITE_TERR_PREFIX + str(whiteTerr))
 
     @pyqtSlot(str)
     def onGameOver(self, resultMsg):
@@ -199,13 +223,18 @@ class ScoreBoard(QDockWidget):
         """
         self.passButton.setEnabled(False)
 
-        # Insert the game over message at
+        # Insert the game over message at the top
         self.onInfoMessage(resultMsg)
 
-        box = QMessageBox(self)
-        box.setWindowTitle("Game Over!")
-        box.setText(resultMsg)
-        box.exec()
+        # Non-modal: show() returns at once, so the event loop keeps
+        # delivering the remaining signals instead of nesting in exec()
+        if self._gameOverBox is None:
+            self._gameOverBox = QMessageBox(self)
+            self._gameOverBox.setWindowTitle("Game Over!")
+            self._gameOverBox.setModal(False)
+        self._gameOverBox.setText(resultMsg)
+        self._gameOverBox.show()
+        self._gameOverBox.raise_()
 
     # ------------------------------ Button Handlers ------------------------------
     def onPassClicked(self):
@@ -222,6 +251,4 @@ class ScoreBoard(QDockWidget):
         if self.board:
             self.board.resetGame()
             self.passButton.setEnabled(True)
-            # Clear the old log? how knows
-            self.logMessages.clear()
-            self.gameLogText.setPlainText("")
+            self.gameLogText.clear()